@@ -0,0 +1,51 @@
+import hashlib
+import pprint
+from pathlib import Path
+
+import yaml
+
+HEADER = '''"""
+Default Config Module
+=====================
+
+Generated from config.yaml in this directory by dev/scripts/generate_default_config.py,
+don't edit it by hand. config.yaml is the source of the default settings; this copy only
+lets a default run skip parsing YAML while config.yaml still has the contents it was
+generated from (SOURCE_HASH).
+
+Attributes:
+- SOURCE_HASH (str): blake2b hash of the config.yaml contents CONFIG was generated from.
+- CONFIG (dict): The default configuration settings.
+"""
+'''
+
+
+def source_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def render_default_config(config_yaml_file: Path) -> str:
+    data = config_yaml_file.read_bytes()
+    config = yaml.safe_load(data)
+
+    source = (
+        f"{HEADER}\n"
+        f'SOURCE_HASH = "{source_hash(data)}"\n\n'
+        f"CONFIG = {pprint.pformat(config, sort_dicts=False)}\n"
+    )
+
+    try:
+        import black
+    except ImportError:  # only used to match the formatting of the rest of the repo
+        return source
+    return black.format_str(source, mode=black.Mode())
+
+
+if __name__ == "__main__":
+    script_dir = Path(__file__).resolve().parent.parent
+    config_dir = script_dir.parent / "fashioncrawler" / "resources" / "config"
+
+    default_config_file = config_dir / "default_config.py"
+    default_config_file.write_text(
+        render_default_config(config_dir / "config.yaml"), encoding="utf-8"
+    )
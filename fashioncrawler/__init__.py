@@ -16,6 +16,14 @@ Modules:
 
 """
 
-from . import scraper
-from . import extractor
-from . import utils
+import importlib
+
+__all__ = ["scraper", "extractor", "utils"]
+
+
+def __getattr__(name):
+    # Subpackages are imported on first access, so a CLI run that exits early (--help,
+    # bad arguments) doesn't pay for importing Selenium, BeautifulSoup and pandas.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
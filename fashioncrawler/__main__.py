@@ -0,0 +1,182 @@
+"""
+Fashion Crawler Entry Point
+===========================
+
+Runs Fashion Crawler from the command line, either as `python -m fashioncrawler` or
+through main.py at the repository root.
+
+Attributes:
+- SCRAPERS (dict): Maps each site name to the names of its scraper and data extractor classes.
+
+Functions:
+- get_site_classes(site): Import and return the scraper and data extractor classes for a site.
+- run_scraper(scraping, extraction, search_query): Run the specified scraper and extract data.
+- scrape_site(site, config, search_query): Scrape one site in its own WebDriver.
+- report_failure(site, error): Log a failed site and print a one-line warning to stderr.
+- main(): Parse the arguments, scrape the enabled sites and write the output.
+"""
+
+# import cProfile
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from fashioncrawler import utils
+
+logger = logging.getLogger(__name__)
+
+# Sites that can be scraped, with the names of their classes in the scraper and extractor
+# packages. The classes are looked up by name so Selenium is only imported once needed.
+SCRAPERS = {
+    "depop": ("DepopScraper", "DepopDataExtractor"),
+    "grailed": ("GrailedScraper", "GrailedDataExtractor"),
+}
+
+
+def get_site_classes(site):
+    """
+    Import and return the scraper and data extractor classes for a site.
+
+    Args:
+    - site: The site name, a key of SCRAPERS.
+
+    Returns:
+    - tuple: The scraper class and the data extractor class.
+    """
+    from fashioncrawler import extractor, scraper
+
+    scraper_name, extractor_name = SCRAPERS[site]
+    return getattr(scraper, scraper_name), getattr(extractor, extractor_name)
+
+
+def run_scraper(scraping, extraction, search_query):
+    """
+    Run the specified scraper and extract data.
+
+    Args:
+    - scraper: The scraper object.
+    - extractor: The data extractor object corresponding to the scraper.
+    - search_query: The search query.
+
+    Returns:
+    - pd.DataFrame: Extracted data as a DataFrame.
+    """
+
+    scraping.run_scraper(search_query)
+    df = extraction.extract_data_to_dataframe()
+    return df
+
+
+def scrape_site(site, config, search_query):
+    """
+    Scrape one site in its own WebDriver, quitting the driver when done.
+
+    Args:
+    - site: The site name, a key of SCRAPERS.
+    - config: The configuration settings.
+    - search_query: The search query.
+
+    Returns:
+    - pd.DataFrame: Extracted data as a DataFrame.
+    """
+    scraper_cls, extractor_cls = get_site_classes(site)
+    scraping = scraper_cls(config)
+    try:
+        extraction = extractor_cls(driver=scraping.driver, config=config)
+        return run_scraper(scraping, extraction, search_query)
+    finally:
+        scraping.driver.quit()
+
+
+def report_failure(site, error):
+    """
+    Log a failed site with its traceback and print a one-line warning to stderr.
+
+    The log only goes to the log file, so without the warning a failed site would be
+    silent on the console.
+
+    Args:
+    - site: The site name, a key of SCRAPERS.
+    - error: The exception the site failed with.
+    """
+    logger.error(f"Scraping {site} failed: {error}", exc_info=error)
+    print(f"Warning: scraping {site} failed: {error}", file=sys.stderr)
+
+
+def main():
+    config = utils.IOUtils.parse_args()
+
+    # imported after parsing so --help and argument errors return without loading Selenium
+    from fashioncrawler.scraper import BaseScraper
+
+    # Ask for the query once up front, the scrapers may run on separate threads
+    search_query = config.get("search_query") or BaseScraper.get_search_query()
+
+    # only sites that returned results get an entry, so the writers never see empty slots
+    dataframes = {}
+
+    enabled_sites = [site["name"] for site in config["sites"] if site["enabled"]]
+    sites = [site for site in enabled_sites if site in SCRAPERS]
+
+    if config["sequential"] or len(sites) < 2:
+        # One Chrome instance is started by the first scraper and reused for every site. The
+        # profiles are kept per scraper class, so a driver shared by several sites is
+        # started without one rather than in the first site's profile.
+        use_profile = len(sites) < 2
+        driver = None
+        previous = None
+        try:
+            for site in sites:
+                scraper_cls, extractor_cls = get_site_classes(site)
+                try:
+                    if previous is not None:
+                        # leave the previous site instead of restarting Chrome
+                        previous.reset()
+                    scraping = scraper_cls(
+                        config, driver=driver, use_profile=use_profile
+                    )
+                    driver = scraping.driver
+                    previous = scraping
+                    extraction = extractor_cls(driver=driver, config=config)
+                    df = run_scraper(scraping, extraction, search_query)
+                except Exception as e:
+                    # keep going, the other sites' results are still written out
+                    report_failure(site, e)
+                    continue
+                if df is not None and len(df):
+                    dataframes[site] = df
+        finally:
+            if driver is not None:
+                driver.quit()
+    else:
+        # The scrapers mostly wait on the network, so each site gets its own driver and
+        # thread (a driver can't be shared between threads) and the sites overlap.
+        with ThreadPoolExecutor(max_workers=len(sites)) as executor:
+            futures = {
+                site: executor.submit(scrape_site, site, config, search_query)
+                for site in sites
+            }
+        for site, future in futures.items():
+            try:
+                df = future.result()
+            except Exception as e:
+                # one site failing doesn't discard the results of the others
+                report_failure(site, e)
+                continue
+            if df is not None and len(df):
+                dataframes[site] = df
+
+    if not dataframes:
+        # nothing to write, and the exit status tells scripts the run produced no results
+        sys.exit("No results were scraped from any site, see logs/fashioncrawler.log")
+
+    output_filename = str(config.get("output", search_query))
+    # the html and pdf templates render a section for each site with results
+    utils.IOUtils.handle_dataframe_output(
+        dataframes, config, list(dataframes), search_query, output_filename
+    )
+
+
+if __name__ == "__main__":
+    # cProfile.run("main()", filename="profile_results.txt")
+    main()
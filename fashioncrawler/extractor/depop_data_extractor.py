@@ -225,10 +225,7 @@ class DepopDataExtractor(BaseDataExtractor):
         """
         return list(
             title.text.strip()
-            for title in sv.select(
-                "div.ProductDetailsSticky-styles__DesktopKeyProductInfo-sc-17bd7b59-9.bKazye > h1",
-                self.soup,
-            )
+            for title in sv.select(DepopScraper.TITLE_SELECTOR, self.soup)
         )
 
     def extract_item_price(self) -> List[str]:
@@ -241,10 +238,7 @@ class DepopDataExtractor(BaseDataExtractor):
         prices = []
 
         # select both the discount and full prices if they exist using pseudo-class
-        price_elements = sv.select(
-            'div.ProductDetailsSticky-styles__StyledProductPrice-sc-17bd7b59-4.qJnzl > div > p:is([aria-label="Full price"], [aria-label="Discounted price"], [aria-label="Price"])',
-            self.soup,
-        )
+        price_elements = sv.select(DepopScraper.PRICE_SELECTOR, self.soup)
 
         for price_element in price_elements:
             if price_element.get("aria-label") in ("Full price", "Price"):
@@ -263,9 +257,7 @@ class DepopDataExtractor(BaseDataExtractor):
         Returns:
             List containing the seller of the item.
         """
-        seller_element = sv.select(
-            "a.sc-eDnWTT.styles__Username-sc-f040d783-3.fRxqiS.WZqly", self.soup
-        )
+        seller_element = sv.select(DepopScraper.SELLER_SELECTOR, self.soup)
         if seller_element:
             return [seller_element[0].text.strip()]
         else:
@@ -280,10 +272,7 @@ class DepopDataExtractor(BaseDataExtractor):
         """
         return list(
             description.text.strip()
-            for description in sv.select(
-                ".styles__Container-sc-d367c36f-0.ffwMQV > p",
-                self.soup,
-            )
+            for description in sv.select(DepopScraper.DESCRIPTION_SELECTOR, self.soup)
         )
 
     def extract_item_condition(self) -> List[str]:
@@ -293,10 +282,7 @@ class DepopDataExtractor(BaseDataExtractor):
         Returns:
             List containing the condition(s) of the item.
         """
-        attribute_elements = sv.select(
-            "div.ProductAttributes-styles__Attributes-sc-303d66c3-1.dIfGXO > p",
-            self.soup,
-        )
+        attribute_elements = sv.select(DepopScraper.ATTRIBUTES_SELECTOR, self.soup)
         conditions = []
 
         if attribute_elements:
@@ -316,10 +302,7 @@ class DepopDataExtractor(BaseDataExtractor):
         Returns:
             List containing the size of the item.
         """
-        attribute_elements = sv.select(
-            "div.ProductAttributes-styles__Attributes-sc-303d66c3-1.dIfGXO > p",
-            self.soup,
-        )
+        attribute_elements = sv.select(DepopScraper.ATTRIBUTES_SELECTOR, self.soup)
         size = []
 
         if len(attribute_elements) >= 3:
@@ -339,7 +322,7 @@ class DepopDataExtractor(BaseDataExtractor):
         extracted_post_times = list(
             map(
                 lambda time_posted: time_posted.text.replace("Listed", "").strip(),
-                sv.select("time[datetime]", self.soup),
+                sv.select(DepopScraper.TIME_POSTED_SELECTOR, self.soup),
             )
         )
 
@@ -355,10 +338,7 @@ class DepopDataExtractor(BaseDataExtractor):
         extracted_image_links = list(
             map(
                 lambda image_link: image_link["src"],
-                sv.select(
-                    "div.styles__ImageContainer-sc-83b41153-2.dpycJk > img:first-child[loading='eager']",
-                    self.soup,
-                ),
+                sv.select(DepopScraper.IMAGE_SELECTOR, self.soup),
             )
         )[:1]
         return extracted_image_links
@@ -0,0 +1,31 @@
+"""
+Default Config Module
+=====================
+
+Generated from config.yaml in this directory by dev/scripts/generate_default_config.py,
+don't edit it by hand. config.yaml is the source of the default settings; this copy only
+lets a default run skip parsing YAML while config.yaml still has the contents it was
+generated from (SOURCE_HASH).
+
+Attributes:
+- SOURCE_HASH (str): blake2b hash of the config.yaml contents CONFIG was generated from.
+- CONFIG (dict): The default configuration settings.
+"""
+
+SOURCE_HASH = "f55467de72d30592d460102c952fd24f"
+
+CONFIG = {
+    "output_formats": ["json"],
+    "output_directory": "output",
+    "sites": [
+        {"name": "grailed", "enabled": True},
+        {"name": "depop", "enabled": True},
+        {"name": "stockx", "enabled": False},
+        {"name": "goat", "enabled": False},
+    ],
+    "count": 30,
+    "subtemplates": {
+        "depop": "depop_subtemplate.html.j2",
+        "grailed": "grailed_subtemplate.html.j2",
+    },
+}
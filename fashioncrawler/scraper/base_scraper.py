@@ -6,7 +6,10 @@ This module provides a base class with functionality for web scraping using Sele
 
 Dependencies:
 - logging: Standard library for logging.
+- os: Standard library for file system paths.
 - sys: Standard library for system-specific parameters and functions.
+- time: Standard library for time-related functions.
+- threading: Standard library for threading.
 - webdriver_manager.chrome: Manages the Chrome WebDriver.
 - selenium: Library for web automation.
 - fashioncrawler.utils.logger_config: Configuration for logging.
@@ -15,9 +18,11 @@ Classes:
 - BaseScraper: Base class for implementing web scraping functionality.
 
 Methods:
-- __init__(self, config): Initializes the scraper with the provided configuration.
-- get_chrome_driver(self, config): Initializes and returns a Chrome WebDriver instance with specified options.
-- configure_driver_options(self, config): Configures the options for the Chrome WebDriver.
+- __init__(self, config, driver=None, use_profile=True): Initializes the scraper with the provided configuration, reusing driver if given.
+- get_chrome_driver(self, config, use_profile=True): Initializes and returns a Chrome WebDriver instance configured from config.
+- get_driver_path(cls): Returns the path of the ChromeDriver executable, installing it on first use.
+- configure_driver_options(self, config, use_profile=True): Configures the options for the Chrome WebDriver.
+- get_profile_dir(self): Returns the persistent Chrome profile directory for the scraper.
 - get_logger(self): Retrieves a logger instance for the scraper.
 - accept_cookies(self, cookie_css_selector): Accepts cookies on the website by locating and clicking the corresponding button.
 - get_search_query(): Prompts the user to enter a search query.
@@ -25,23 +30,35 @@ Methods:
 - type_search(self, search, search_bar_css_selector, submit_button_css_selector): Enters the provided search query into the search bar and submits the search.
 - get_to_search_bar_to_search(self, search_bar_css_selector, timeout=2): Navigates to the search bar and interacts with it to initiate a search.
 - navigate_to_search_bar(self, base_url, search_bar_css_selector): Navigates to the search bar of the website.
+- count_class_elements(self, class_name): Counts the elements matching the specified class in the browser.
+- wait_for_class_count(self, class_name, min_count, timeout): Waits in the browser until more than min_count elements match the specified class.
 - wait_until_class_count_exceeds(self, class_name, min_count, timeout=5): Waits until the number of elements matching the specified class exceeds a minimum count.
 - wait_for_page_load(self, class_name): Waits for the page to load completely.
 - run_scraper(self, search_query): Abstract method to run the scraper for a given search query.
+- reset(self): Leave the current site so the driver can be reused for another site.
 
 Exceptions:
 - NoSuchElementException: Raised when an element could not be found.
 - StaleElementReferenceException: Raised when a reference to an element is no longer valid.
 - TimeoutException: Raised when a timeout occurs while waiting for an element or condition.
+- JavascriptException: Raised when a script fails in the browser, e.g. because the page was unloaded.
+- ScriptTimeoutException: Raised when an asynchronous script doesn't finish within the script timeout.
+- SessionNotCreatedException: Raised when Chrome can't be started, e.g. because its profile is in use.
 """
 
 import logging
+import os
 import sys
+import threading
+import time
 from abc import abstractmethod
 
 from selenium import webdriver
 from selenium.common.exceptions import (
+    JavascriptException,
     NoSuchElementException,
+    ScriptTimeoutException,
+    SessionNotCreatedException,
     StaleElementReferenceException,
     TimeoutException,
 )
@@ -55,6 +72,41 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 import fashioncrawler.utils.logger_config as logger_config
 
+# Chrome profiles kept between runs, one per scraper, so the browser's disk cache (scripts,
+# stylesheets, fonts) and cookies carry over to the next scrape of the same site.
+CHROME_PROFILE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "fashioncrawler",
+    "chrome-profiles",
+)
+
+# Resolves as soon as more than arguments[1] elements have the classes in arguments[0]. A
+# MutationObserver rechecks the (live) collection after every DOM change, so the wait ends
+# right when the elements arrive instead of on the next poll. It gives up after
+# arguments[2] seconds, when the WebDriver script timeout has expired too.
+_WAIT_FOR_CLASS_COUNT_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const items = document.getElementsByClassName(arguments[0]);
+const minCount = arguments[1];
+if (items.length > minCount) {
+    done();
+    return;
+}
+const observer = new MutationObserver(() => {
+    if (items.length > minCount) {
+        observer.disconnect();
+        done();
+    }
+});
+observer.observe(document.documentElement, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ["class"],
+});
+setTimeout(() => observer.disconnect(), arguments[2] * 1000);
+"""
+
 
 class BaseScraper:
     """
@@ -64,9 +116,12 @@ class BaseScraper:
         config (dict):
             Configuration settings for the web scraper.
 
+        BLOCK_IMAGES_PREFS (dict):
+            Chrome preferences that stop images from being downloaded.
+
     Methods:
-        __init__(self, config):
-            Initializes the scraper with the provided configuration.
+        __init__(self, config, driver=None):
+            Initializes the scraper with the provided configuration, reusing driver if given.
 
         accept_cookies(self, cookie_css_selector: str) -> None:
             Accepts cookies on the website by locating and clicking the corresponding button.
@@ -86,64 +141,159 @@ class BaseScraper:
         navigate_to_search_bar(self, base_url: str, search_bar_css_selector: str) -> None:
             Navigate to the search bar of the website.
 
+        count_class_elements(self, class_name: str) -> int:
+            Count the elements matching the specified class in the browser.
+
+        wait_for_class_count(self, class_name: str, min_count: int, timeout) -> None:
+            Wait in the browser until more than min_count elements match the specified class.
+
         wait_until_class_count_exceeds(self, class_name: str, min_count: int, timeout=5) -> None:
             Wait until the number of elements matching the specified class exceeds a minimum count.
 
-        get_chrome_driver(options):
-            Initialize and return a Chrome WebDriver instance with specified options.
+        get_chrome_driver(self, config, use_profile=True):
+            Initialize and return a Chrome WebDriver instance configured from config.
+
+        get_driver_path(cls) -> str:
+            Return the path of the ChromeDriver executable, installing it on first use.
 
-        configure_driver_options(config):
+        configure_driver_options(config, use_profile=True):
             Configure the options for the Chrome WebDriver.
 
+        get_profile_dir(self) -> str:
+            Return the persistent Chrome profile directory for the scraper.
+
         wait_for_page_load(self, class_name: str, min_count: int) -> None:
             Wait for the page to load completely.
 
         run_scraper(self, search_query):
             Abstract method to run the scraper for a given search query.
 
+        reset(self):
+            Leave the current site so the driver can be reused for another site.
+
         get_logger(self) -> logging.Logger:
             Retrieves a logger instance for the scraper.
     """
 
-    def __init__(self, config):
+    # Chrome preferences that stop images from being downloaded. Only the image URLs are
+    # scraped, and those are still in the page source when the images don't load.
+    BLOCK_IMAGES_PREFS = {"profile.managed_default_content_settings.images": 2}
+
+    # Path of the ChromeDriver executable, resolved once per process by get_driver_path
+    _driver_path = None
+    _driver_path_lock = threading.Lock()
+
+    def __init__(self, config, driver=None, use_profile=True):
         self.config = config
         self.logger = self.get_logger()
-        self.driver = self.get_chrome_driver(config)
+        # Starting Chrome is the slowest part of a small scrape, so a driver can be shared
+        self.driver = (
+            driver
+            if driver is not None
+            else self.get_chrome_driver(config, use_profile=use_profile)
+        )
 
-    def get_chrome_driver(self, config):
+    def get_chrome_driver(self, config, use_profile=True):
         """
-        Initialize and return a Chrome WebDriver instance with specified options.
+        Initialize and return a Chrome WebDriver instance configured from config.
+
+        The options come from configure_driver_options. If Chrome can't open the persistent
+        profile, e.g. because another run is using it, a throwaway profile is used instead.
 
         Args:
-        - options: An instance of ChromeOptions configured with desired browser options.
+        - config: The configuration settings.
+        - use_profile: Whether to start Chrome with the scraper's persistent profile. A
+          driver shared between sites doesn't, so no site's state ends up in another's.
 
         Returns:
         - driver: A Chrome WebDriver instance ready for use.
         """
-        options = self.configure_driver_options(config)
-        return webdriver.Chrome(
-            options=options, service=ChromeService(ChromeDriverManager().install())
-        )
+        options = self.configure_driver_options(config, use_profile=use_profile)
+        try:
+            return webdriver.Chrome(
+                options=options,
+                service=ChromeService(self.get_driver_path()),
+            )
+        except SessionNotCreatedException as e:
+            if not use_profile:
+                raise
+            # Chrome can't open a profile that another run is still using
+            self.logger.warning(
+                f"Could not start Chrome with the saved profile, using a new one: {e}"
+            )
+            options = self.configure_driver_options(config, use_profile=False)
+            return webdriver.Chrome(
+                options=options,
+                service=ChromeService(self.get_driver_path()),
+            )
+
+    @classmethod
+    def get_driver_path(cls) -> str:
+        """
+        Return the path of the ChromeDriver executable, installing it on first use.
+
+        ChromeDriverManager().install() checks the installed version against the latest
+        release on every call, so the path is resolved once and shared by every driver.
+        Setting the CHROMEDRIVER_PATH environment variable skips ChromeDriverManager
+        altogether, e.g. in CI or offline.
+
+        Returns:
+        - str: The path of the ChromeDriver executable.
+        """
+        if BaseScraper._driver_path is None:
+            # the sites start their drivers on separate threads
+            with BaseScraper._driver_path_lock:
+                if BaseScraper._driver_path is None:
+                    BaseScraper._driver_path = (
+                        os.environ.get("CHROMEDRIVER_PATH")
+                        or ChromeDriverManager().install()
+                    )
+        return BaseScraper._driver_path
 
-    def configure_driver_options(self, config):
+    def configure_driver_options(self, config, use_profile=True):
         """
         Configure the options for the Chrome WebDriver.
 
+        Args:
+        - config: The configuration settings.
+        - use_profile: Whether to use the persistent profile from get_profile_dir, instead
+          of the throwaway profile Chrome creates for each session.
+
         Returns:
         - options: The configured ChromeOptions instance.
         """
         options = Options()
 
+        if use_profile:
+            options.add_argument(f"--user-data-dir={self.get_profile_dir()}")
+
         if sys.platform.startswith("win"):
             options.add_argument("--log-level=3")
 
         options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("prefs", self.BLOCK_IMAGES_PREFS)
+        # driver.get() returns once the DOM is ready, the scrapers wait for what they need
+        options.page_load_strategy = "eager"
 
         if config["headless"]:
             options.add_argument("--headless=new")
 
         return options
 
+    def get_profile_dir(self) -> str:
+        """
+        Return the persistent Chrome profile directory for the scraper, creating it if needed.
+
+        Each scraper class gets its own directory, so sites scraped in parallel never try to
+        open the same profile.
+
+        Returns:
+        - str: The absolute path of the profile directory.
+        """
+        profile_dir = os.path.join(CHROME_PROFILE_DIR, type(self).__name__.lower())
+        os.makedirs(profile_dir, exist_ok=True)
+        return profile_dir
+
     def get_logger(self) -> logging.Logger:
         """
         Retrieves a logger instance for the scraper.
@@ -287,6 +437,67 @@ class BaseScraper:
         self.driver.get(base_url)
         self.get_to_search_bar_to_search(search_bar_css_selector)
 
+    def count_class_elements(self, class_name: str) -> int:
+        """
+        Count the elements matching the specified class in the browser.
+
+        Counting in the page means only the number is sent back over the WebDriver
+        protocol, instead of a reference to every matching element.
+
+        Args:
+        - class_name: The CSS class name of the elements to count, dot-separated for
+          elements that must have several classes.
+
+        Returns:
+        - int: The number of matching elements.
+        """
+        return self.driver.execute_script(
+            "return document.getElementsByClassName(arguments[0]).length;",
+            class_name.replace(".", " "),
+        )
+
+    def wait_for_class_count(self, class_name: str, min_count: int, timeout) -> None:
+        """
+        Wait in the browser until more than min_count elements match the specified class.
+
+        The check runs in the page on every DOM change, so a single WebDriver command
+        covers the whole wait. If the page is navigated away while waiting, the rest of
+        the wait polls the new page with count_class_elements instead.
+
+        Args:
+        - class_name: The CSS class name of the elements to count, dot-separated for
+          elements that must have several classes.
+        - min_count: The number of elements that has to be exceeded.
+        - timeout: The maximum time to wait in seconds.
+
+        Raises:
+        - TimeoutException: If the count isn't exceeded within the timeout.
+        """
+        started = time.monotonic()
+        # the script timeout applies to the whole session, so put it back afterwards
+        previous_script_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout)
+        try:
+            self.driver.execute_async_script(
+                _WAIT_FOR_CLASS_COUNT_SCRIPT,
+                class_name.replace(".", " "),
+                min_count,
+                timeout,
+            )
+        except ScriptTimeoutException as e:
+            # not a TimeoutException subclass, the callers expect the same error either way
+            raise TimeoutException(
+                f"Class count did not exceed {min_count} within {timeout}s"
+            ) from e
+        except JavascriptException:
+            # the page the observer ran in was unloaded, keep waiting on the new one
+            remaining = max(0, timeout - (time.monotonic() - started))
+            WebDriverWait(self.driver, remaining).until(
+                lambda driver: self.count_class_elements(class_name) > min_count
+            )
+        finally:
+            self.driver.set_script_timeout(previous_script_timeout)
+
     def wait_until_class_count_exceeds(
         self, class_name: str, min_count: int, timeout=5
     ) -> None:
@@ -302,12 +513,7 @@ class BaseScraper:
         - None
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: len(
-                    self.driver.find_elements(By.CSS_SELECTOR, f".{class_name}")
-                )
-                > min_count
-            )
+            self.wait_for_class_count(class_name, min_count, timeout)
             # TODO: Explore logging the scraper instead of the class name or associating classes with scraper.
             self.logger.info(
                 f"Number of elements matching class '{class_name} exceeded {min_count}."
@@ -334,6 +540,20 @@ class BaseScraper:
         min_count = self.config["count"]
         self.wait_until_class_count_exceeds(class_name, min_count)
 
+    def reset(self) -> None:
+        """
+        Leave the current site so the driver can be reused for another site.
+
+        Navigates to a blank page, which is much cheaper than quitting and starting a new
+        Chrome. Cookies and storage are left alone: they are kept per site anyway, and the
+        driver uses the persistent profile, so clearing them would log the user out and
+        bring back the cookie banners on the next run.
+
+        Returns:
+        - None
+        """
+        self.driver.get("about:blank")
+
     @abstractmethod
     def run_scraper(self, search_query):
         """
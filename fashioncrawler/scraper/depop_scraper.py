@@ -5,18 +5,24 @@ Depop Scraper Module
 This module provides functionality for scraping data from the Depop website.
 
 Dependencies:
-- threading: Standard library for threading.
+- queue: Standard library for thread-safe queues.
 - time: Standard library for time-related functions.
 - concurrent.futures: Standard library for concurrency primitives.
 - logging: Standard library for logging.
+- requests: Library for making HTTP requests.
+- BeautifulSoup: Library for parsing HTML documents.
+- soupsieve: A CSS selector library for BeautifulSoup.
 - selenium: Library for web automation.
-- webdriver_manager: Library for managing web drivers.
 - fashioncrawler.utils.logger_config: Module for configuring loggers.
 - .base_scraper: Module providing the BaseScraper class for web scraping.
 
 Classes:
 - DepopScraper: Subclass of BaseScraper for scraping data from the Depop website.
 
+Functions:
+- _build_listing_page_options() -> Options:
+    Build the Chrome options for the drivers that fetch Depop listing pages.
+
 Attributes:
 - COOKIE_CSS_SELECTOR (str):
     CSS selector for the cookies button.
@@ -34,10 +40,21 @@ Attributes:
     CSS class name for identifying items on the page.
 - MIN_COUNT (int):
     Minimum count of items to wait for during page load.
+- HTTP_HEADERS (dict):
+    Headers sent when fetching listing pages over plain HTTP.
+- PRODUCT_PAGE_MARKER (str):
+    Text only found in a fully server-rendered listing page.
+- TITLE_SELECTOR, PRICE_SELECTOR, SELLER_SELECTOR, DESCRIPTION_SELECTOR,
+  ATTRIBUTES_SELECTOR, TIME_POSTED_SELECTOR, IMAGE_SELECTOR (str):
+    CSS selectors of the listing page fields read by DepopDataExtractor.
+- REQUIRED_LISTING_SELECTORS (tuple):
+    Selectors that must match before a listing page source is used.
+- LISTING_PAGE_TIMEOUT (int):
+    Seconds a listing page driver waits for the required fields to render.
 
 Methods:
-- __init__(self, config):
-    Initializes the Depop scraper with the base scraper object.
+- __init__(self, config, driver=None, use_profile=True):
+    Initializes the Depop scraper, reusing driver if given.
 - run_scraper(self, search_query) -> None:
     Runs the Depop scraper to search for items based on the provided search query.
 - get_to_search_bar_to_search(
@@ -55,20 +72,22 @@ Methods:
     Enter the provided search query into the search bar and submit the search.
 - _navigate_and_search(self, search_query: str) -> None:
     Navigates to the search bar and performs a search based on the provided query.
-- get_logger() -> logging.Logger:
-    Retrieves a static logger instance for the static methods in DepopScraper.
 - get_page_sources_concurrently(urls):
     Fetches page sources concurrently for a list of URLs using ThreadPoolExecutor.
-- _fetch_update_page_source(
+- _fetch_page_sources_over_http(urls, max_workers=10, timeout=10):
+    Fetches the page sources that don't need a browser over plain HTTP.
+- _fetch_page_source_over_http(session, url, timeout):
+    Fetches a single page source over plain HTTP.
+- _missing_listing_fields(page_source) -> list:
+    Returns the required listing page selectors that don't match in page_source.
+- _fetch_page_source(
     url: str,
-    page_sources,
-    lock: threading.Lock,
-    options: Options,
+    driver_pool: queue.Queue,
     logger: logging.Logger,
     max_retries: int,
     backoff_delay: int
-):
-    Fetches and updates the page source for a given URL.
+) -> tuple:
+    Fetches the page source for a given URL.
 
 Exceptions:
 - NoSuchElementException: Raised when an element could not be found.
@@ -79,10 +98,13 @@ Exceptions:
 """
 
 import logging
-import threading
+import queue
 import time
 from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 
+import requests
+import soupsieve as sv
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -96,13 +118,32 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 import fashioncrawler.utils.logger_config as logger_config
 
 from .base_scraper import BaseScraper
 
 
+def _build_listing_page_options() -> Options:
+    """
+    Build the Chrome options for the drivers that fetch Depop listing pages.
+
+    Returns:
+    - options: The configured ChromeOptions instance.
+    """
+    options = Options()
+    options.add_argument("--log-level=3")
+    options.add_experimental_option("prefs", BaseScraper.BLOCK_IMAGES_PREFS)
+    # driver.get() returns once the DOM is ready, _fetch_page_source then waits for the
+    # listing fields before reading the page source
+    options.page_load_strategy = "eager"
+    return options
+
+
+# Options shared by every listing page driver, they are only read when a driver starts
+_LISTING_PAGE_OPTIONS = _build_listing_page_options()
+
+
 class DepopScraper(BaseScraper):
     """
     Subclass of BaseScraper for scraping data from the Depop website.
@@ -124,10 +165,21 @@ class DepopScraper(BaseScraper):
             CSS class name for identifying items on the page.
         MIN_COUNT (int):
             Minimum count of items to wait for during page load.
+        HTTP_HEADERS (dict):
+            Headers sent when fetching listing pages over plain HTTP.
+        PRODUCT_PAGE_MARKER (str):
+            Text only found in a fully server-rendered listing page.
+        TITLE_SELECTOR, PRICE_SELECTOR, SELLER_SELECTOR, DESCRIPTION_SELECTOR,
+        ATTRIBUTES_SELECTOR, TIME_POSTED_SELECTOR, IMAGE_SELECTOR (str):
+            CSS selectors of the listing page fields read by DepopDataExtractor.
+        REQUIRED_LISTING_SELECTORS (tuple):
+            Selectors that must match before a listing page source is used.
+        LISTING_PAGE_TIMEOUT (int):
+            Seconds a listing page driver waits for the required fields to render.
 
     Methods:
-        __init__(self, base_scraper):
-            Initializes the Depop scraper with the base scraper object.
+        __init__(self, config, driver=None, use_profile=True):
+            Initializes the Depop scraper, reusing driver if given.
         run_scraper(self, search_query) -> None:
             Runs the Depop scraper to search for items based on the provided search query.
         get_to_search_bar_to_search(
@@ -145,20 +197,22 @@ class DepopScraper(BaseScraper):
             Enter the provided search query into the search bar and submit the search.
         _navigate_and_search(self, search_query: str) -> None:
             Navigates to the search bar and performs a search based on the provided query.
-        get_logger() -> logging.Logger:
-            Retrieves a static logger instance for the static methods in DepopScraper.
         get_page_sources_concurrently(urls):
             Fetches page sources concurrently for a list of URLs using ThreadPoolExecutor.
-        _fetch_update_page_source(
+        _fetch_page_sources_over_http(urls, max_workers=10, timeout=10):
+            Fetches the page sources that don't need a browser over plain HTTP.
+        _fetch_page_source_over_http(session, url, timeout):
+            Fetches a single page source over plain HTTP.
+        _missing_listing_fields(page_source) -> list:
+            Returns the required listing page selectors that don't match in page_source.
+        _fetch_page_source(
             url: str,
-            page_sources,
-            lock: threading.Lock,
-            options: Options,
+            driver_pool: queue.Queue,
             logger: logging.Logger,
             max_retries: int,
             backoff_delay: int
-        ):
-            Fetches and updates the page source for a given URL.
+        ) -> tuple:
+            Fetches the page source for a given URL.
     """
 
     # Element selectors
@@ -177,10 +231,43 @@ class DepopScraper(BaseScraper):
     # Item related constants for page loading
     ITEM_CLASS_NAME = "styles__ProductImageGradient-sc-4aad5806-6.hzrneU"  # use image as there isn't a container for items
 
+    # Listing pages are server-rendered, so most can be fetched without a browser
+    HTTP_HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+    # part of the class names the data extractor selects, missing from bot-check pages
+    PRODUCT_PAGE_MARKER = "ProductDetailsSticky"
+
+    # Listing page fields, read by DepopDataExtractor
+    TITLE_SELECTOR = "div.ProductDetailsSticky-styles__DesktopKeyProductInfo-sc-17bd7b59-9.bKazye > h1"
+    PRICE_SELECTOR = 'div.ProductDetailsSticky-styles__StyledProductPrice-sc-17bd7b59-4.qJnzl > div > p:is([aria-label="Full price"], [aria-label="Discounted price"], [aria-label="Price"])'
+    SELLER_SELECTOR = "a.sc-eDnWTT.styles__Username-sc-f040d783-3.fRxqiS.WZqly"
+    DESCRIPTION_SELECTOR = ".styles__Container-sc-d367c36f-0.ffwMQV > p"
+    ATTRIBUTES_SELECTOR = (
+        "div.ProductAttributes-styles__Attributes-sc-303d66c3-1.dIfGXO > p"
+    )
+    TIME_POSTED_SELECTOR = "time[datetime]"
+    IMAGE_SELECTOR = "div.styles__ImageContainer-sc-83b41153-2.dpycJk > img:first-child[loading='eager']"
+    # The extractor adds no value for these fields when they are missing, which leaves its
+    # columns with different lengths, so a page source is only used once they all match.
+    REQUIRED_LISTING_SELECTORS = (
+        TITLE_SELECTOR,
+        PRICE_SELECTOR,
+        DESCRIPTION_SELECTOR,
+        TIME_POSTED_SELECTOR,
+    )
+    # Seconds a listing page driver waits for the required fields to render
+    LISTING_PAGE_TIMEOUT = 10
+
     logger = logger_config.configure_logger()
 
-    def __init__(self, config):
-        super().__init__(config=config)
+    def __init__(self, config, driver=None, use_profile=True):
+        super().__init__(config=config, driver=driver, use_profile=use_profile)
 
     def run_scraper(self, search_query: str) -> None:
         """
@@ -224,7 +311,8 @@ class DepopScraper(BaseScraper):
             TimeoutException,
         ) as e:
             self.logger.error(f"Error interacting with search bar: {e}", exc_info=True)
-            self.driver.quit()
+            # the driver may be shared with other sites, so leave quitting it to the caller
+            raise
 
     def type_search(
         self,
@@ -290,12 +378,12 @@ class DepopScraper(BaseScraper):
         Returns:
         - None
         """
-        current_count = len(self.driver.find_elements(By.CLASS_NAME, class_name))
+        current_count = self.count_class_elements(class_name)
         while current_count <= min_count:
             footer = self.driver.find_element(By.ID, "footer")
             ActionChains(self.driver).scroll_to_element(footer).perform()
             self.driver.implicitly_wait(2)
-            current_count = len(self.driver.find_elements(By.CLASS_NAME, class_name))
+            current_count = self.count_class_elements(class_name)
 
     def wait_until_class_count_exceeds(
         self, class_name: str, min_count: int, timeout=5
@@ -312,12 +400,7 @@ class DepopScraper(BaseScraper):
         - None
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: len(
-                    self.driver.find_elements(By.CSS_SELECTOR, f".{class_name}")
-                )
-                > min_count
-            )
+            self.wait_for_class_count(class_name, min_count, timeout)
             # TODO: Explore logging the scraper instead of the class name or associating classes with scraper.
             self.logger.info(
                 f"Number of elements matching class '{class_name} exceeded {min_count}."
@@ -348,7 +431,7 @@ class DepopScraper(BaseScraper):
         - driver: A Chrome WebDriver instance ready for use.
         """
         return webdriver.Chrome(
-            options=options, service=ChromeService(ChromeDriverManager().install())
+            options=options, service=ChromeService(DepopScraper.get_driver_path())
         )
 
     def _navigate_and_search(self, search_query: str) -> None:
@@ -390,10 +473,16 @@ class DepopScraper(BaseScraper):
             page_sources = DepopScraper.get_page_sources_concurrently(urls)
         """
 
-        page_sources = {}
-        lock = threading.Lock()
-        options = Options()
-        options.add_argument("--log-level=3")
+        # Most pages come back fine over plain HTTP, only the rest need a browser each
+        page_sources = DepopScraper._fetch_page_sources_over_http(urls)
+        remaining = [url for url in urls if url not in page_sources]
+        if not remaining:
+            return page_sources
+
+        # Drivers are handed back here after a page and reused for the next one, so there
+        # are at most max_workers Chrome instances, started once each. Each one is pooled
+        # as (driver, cookies_accepted).
+        driver_pool = queue.Queue()
 
         logger = DepopScraper.logger
 
@@ -402,31 +491,32 @@ class DepopScraper(BaseScraper):
         max_retries = 3
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
+            future_to_url = {
                 executor.submit(
-                    DepopScraper._fetch_update_page_source,
+                    DepopScraper._fetch_page_source,
                     url,
-                    page_sources,
-                    lock,
-                    options,
+                    driver_pool,
                     logger,
                     max_retries,
                     backoff_delay,
-                )
-                for url in urls
-            ]
+                ): url
+                for url in remaining
+            }
+            futures = list(future_to_url)
             try:
+                # the workers return their results, so only this thread writes page_sources
                 for future in as_completed(futures):
                     try:
-                        future.result()
+                        url, source = future.result()
+                        if source is not None:
+                            page_sources[url] = source
                     except CancelledError:
                         logger.error("Task canceled:", exc_info=True)
                     except Exception as e:
                         logger.error(
-                            f"Error fetching page source for {future.result()}: {e}",
+                            f"Error fetching page source for {future_to_url[future]}: {e}",
                             exc_info=True,
                         )
-                        future.cancel()
             except KeyboardInterrupt:
                 # Handle keyboard interrupt at the outer level
                 logger.error(
@@ -437,57 +527,184 @@ class DepopScraper(BaseScraper):
             finally:
                 for f in futures:
                     f.cancel()
+        while not driver_pool.empty():
+            driver, _ = driver_pool.get_nowait()
+            driver.quit()
+        # keep the order of the search results
+        return {url: page_sources[url] for url in urls if url in page_sources}
+
+    @staticmethod
+    def _fetch_page_sources_over_http(urls, max_workers=10, timeout=10):
+        """
+        Fetches the page sources that don't need a browser over plain HTTP.
+
+        Args:
+            - urls (list): List of URLs for which to fetch page sources.
+            - max_workers (int): Maximum number of requests in flight at once.
+            - timeout (int): Timeout of each request in seconds.
+
+        Returns:
+            - dict: The URLs that were fetched, in order, mapped to their page sources.
+              URLs that failed or were answered with a bot check are left out.
+        """
+        page_sources = {}
+
+        with requests.Session() as session:
+            session.headers.update(DepopScraper.HTTP_HEADERS)
+            # one pooled connection per worker, reused for every request to Depop
+            session.mount(
+                "https://", requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                sources = executor.map(
+                    lambda url: DepopScraper._fetch_page_source_over_http(
+                        session, url, timeout
+                    ),
+                    urls,
+                )
+                for url, source in zip(urls, sources):
+                    if source:
+                        page_sources[url] = source
+
+        DepopScraper.logger.debug(
+            f"Fetched {len(page_sources)} of {len(urls)} page sources over HTTP."
+        )
         return page_sources
 
     @staticmethod
-    def _fetch_update_page_source(
+    def _fetch_page_source_over_http(session, url, timeout):
+        """
+        Fetches a single page source over plain HTTP.
+
+        Args:
+            session (requests.Session): The session to send the request with.
+            url (str): The URL for which to fetch the page source.
+            timeout (int): Timeout of the request in seconds.
+
+        Returns:
+            str | None: The page source, or None if the page has to be loaded in a browser.
+        """
+        try:
+            response = session.get(url, timeout=timeout)
+        except requests.RequestException as e:
+            DepopScraper.logger.debug(f"HTTP request for '{url}' failed: {e}")
+            return None
+
+        if (
+            response.status_code != 200
+            or DepopScraper.PRODUCT_PAGE_MARKER not in response.text
+        ):
+            DepopScraper.logger.debug(
+                f"'{url}' needs a browser (HTTP status {response.status_code})"
+            )
+            return None
+
+        # fields rendered client-side are missing from the server's HTML
+        missing = DepopScraper._missing_listing_fields(response.text)
+        if missing:
+            DepopScraper.logger.debug(
+                f"'{url}' needs a browser, missing over HTTP: {', '.join(missing)}"
+            )
+            return None
+
+        return response.text
+
+    @staticmethod
+    def _missing_listing_fields(page_source):
+        """
+        Returns the required listing page selectors that don't match in page_source.
+
+        Args:
+            page_source (str): The HTML of a listing page.
+
+        Returns:
+            list: The selectors of REQUIRED_LISTING_SELECTORS without a match, empty if the
+            page has every field the data extractor reads.
+        """
+        soup = BeautifulSoup(page_source, "lxml")
+        return [
+            selector
+            for selector in DepopScraper.REQUIRED_LISTING_SELECTORS
+            if sv.select_one(selector, soup) is None
+        ]
+
+    @staticmethod
+    def _fetch_page_source(
         url: str,
-        page_sources,
-        lock: threading.Lock,
-        options: Options,
+        driver_pool: queue.Queue,
         logger: logging.Logger,
         max_retries: int,
         backoff_delay: int,
-    ):
+    ) -> tuple:
         """
-        Fetches and updates the page source for a given URL.
+        Fetches the page source for a given URL.
 
         Args:
             url (str): The URL for which to fetch the page source.
-            page_sources (dict): A dictionary to store the fetched page sources.
-            lock (threading.Lock): A lock to ensure thread-safe access to shared resources.
-            options (Options): Chrome options for configuring the WebDriver.
+            driver_pool (queue.Queue): Idle (WebDriver, cookies_accepted) pairs to reuse, the
+                driver is returned to it afterwards.
             logger (logging.Logger): Logger instance for logging messages.
             max_retries (int): Maximum number of retries in case of failure.
             backoff_delay (int): Initial backoff delay in seconds.
 
-        This method fetches the page source for a given URL using a Chrome WebDriver.
-        It retries a maximum number of times (max_retries) in case of failure.
+        This method fetches the page source for a given URL using a Chrome WebDriver from
+        driver_pool, starting a new one when none is idle. Only a new driver waits for the cookie
+        banner. The page source is read once every field in REQUIRED_LISTING_SELECTORS has
+        rendered. It retries a maximum number of times (max_retries) in case of failure.
         The backoff delay increases exponentially with each retry.
-        After successfully fetching the page source, it updates the page_sources dictionary with the URL and its corresponding page source.
 
+        Returns:
+            tuple: The URL and its page source, or None in place of the page source if every
+            attempt failed.
         """
         retries = 0
         while retries < max_retries:
-            driver = DepopScraper.get_static_chrome_driver(options)
+            try:
+                driver, cookies_accepted = driver_pool.get_nowait()
+            except queue.Empty:
+                driver = DepopScraper.get_static_chrome_driver(_LISTING_PAGE_OPTIONS)
+                cookies_accepted = False
             # Catch various exceptions that might occur during navigation
             logger.info(f"Trying to access page_source for url {url}")
             try:
                 driver.get(url)
 
-                cookies_button = WebDriverWait(driver, 2).until(
-                    EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, DepopScraper.COOKIE_CSS_SELECTOR)
+                # the banner only shows once per browser, so a reused driver skips the wait
+                if not cookies_accepted:
+                    try:
+                        cookies_button = WebDriverWait(driver, 2).until(
+                            EC.element_to_be_clickable(
+                                (By.CSS_SELECTOR, DepopScraper.COOKIE_CSS_SELECTOR)
+                            )
+                        )
+                        ActionChains(driver).double_click(cookies_button).perform()
+                    except TimeoutException:
+                        pass  # no banner was shown
+
+                # the eager load strategy returns before the client-rendered fields exist
+                try:
+                    WebDriverWait(driver, DepopScraper.LISTING_PAGE_TIMEOUT).until(
+                        lambda driver: all(
+                            driver.find_elements(By.CSS_SELECTOR, selector)
+                            for selector in DepopScraper.REQUIRED_LISTING_SELECTORS
+                        )
                     )
-                )
-                ActionChains(driver).double_click(cookies_button).perform()
-
-                with lock:
-                    page_sources[url] = driver.page_source
-                break  # Break out of the retry loop if successful
-            except (WebDriverException, TimeoutException) as e:
+                except TimeoutException:
+                    logger.debug(f"Listing fields of '{url}' didn't render in time")
+                    # the driver itself is fine, keep it for the retry
+                    driver_pool.put((driver, True))
+                    retries += 1
+                    time.sleep(backoff_delay * retries)  # Increasing delay for retries
+                    continue
+
+                page_source = driver.page_source
+                driver_pool.put((driver, True))
+                return url, page_source
+            except WebDriverException as e:
                 logger.debug(f"Error fetching page source for '{url}': {e}")
+                # the driver may be broken, so it is quit instead of going back to the pool
+                driver.quit()
                 retries += 1
                 time.sleep(backoff_delay * retries)  # Increasing delay for retries
-            finally:
-                driver.quit()
+
+        return url, None
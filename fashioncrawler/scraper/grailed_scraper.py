@@ -5,7 +5,6 @@ Grailed Scraper Module
 This module provides functionality for scraping data from the Grailed website.
 
 Dependencies:
-- sys: Standard library for system-specific parameters and functions.
 - selenium.common.exceptions: Module providing exceptions for the Selenium WebDriver.
 - selenium.webdriver: Module providing classes for accessing web browsers.
 - selenium.webdriver.common.by: Module providing mechanisms for locating elements by various strategies.
@@ -27,15 +26,13 @@ Attributes:
 - MIN_COUNT (int): Minimum count of items to wait for during page load.
 
 Methods:
-- __init__(self, config): Initializes the Grailed scraper with the base scraper object.
+- __init__(self, config, driver=None, use_profile=True): Initializes the Grailed scraper, reusing driver if given.
 - run_scraper(self, search_query) -> None: Runs the Grailed scraper to search for items based on the provided search query.
 - _navigate_and_search(self, search_query: str) -> None: Navigates to the search bar and performs a search based on the provided query.
 - get_to_search_bar_to_search(self, search_bar_css_selector: str, timeout=2) -> None: Navigate to the search bar and interact with it to initiate a search.
 - _dismiss_login_popup(self, timeout: int) -> None: Dismisses the login popup within a specified timeout period.
 """
 
-import sys
-
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
@@ -63,7 +60,7 @@ class GrailedScraper(BaseScraper):
     - MIN_COUNT (int): Minimum count of items to wait for during page load.
 
     Methods:
-    - __init__(self, base_scraper): Initializes the Grailed scraper with the base scraper object.
+    - __init__(self, config, driver=None, use_profile=True): Initializes the Grailed scraper, reusing driver if given.
     - run_scraper(self, search_query) -> None: Runs the Grailed scraper to search for items based on the provided search query.
     - _navigate_and_search(self, search_query: str) -> None: Navigates to the search bar and performs a search based on the provided query.
     - get_to_search_bar_to_search(self, search_bar_css_selector: str, timeout=2) -> None: Navigate to the search bar and interact with it to initiate a search.
@@ -76,13 +73,21 @@ class GrailedScraper(BaseScraper):
     SEARCH_BAR_SUBMIT_CSS_SELECTOR = ".Button-module__button___fE9iu.Button-module__small___uF0cg.Button-module__secondary___gYP5i.Form-module__searchButton___WDphC"
     COOKIES_CSS_SELECTOR = "#onetrust-accept-btn-handler"
 
+    # Built once for the waits in _dismiss_login_popup. The condition keeps no state, so
+    # every instance can share it for both waiting for the popup and for it to go away.
+    # It is a plain function, staticmethod stops it being bound to the scraper.
+    _LOGIN_POPUP_LOCATOR = (By.CSS_SELECTOR, LOGIN_POPUP_SELECTOR)
+    _LOGIN_POPUP_PRESENT = staticmethod(
+        EC.presence_of_element_located(_LOGIN_POPUP_LOCATOR)
+    )
+
     BASE_URL = "https://grailed.com"
 
     # Item related constants
     ITEM_CLASS_NAME = "feed-item"
 
-    def __init__(self, config):
-        super().__init__(config=config)
+    def __init__(self, config, driver=None, use_profile=True):
+        super().__init__(config=config, driver=driver, use_profile=use_profile)
 
     def run_scraper(self, search_query) -> None:
         """
@@ -136,12 +141,7 @@ class GrailedScraper(BaseScraper):
             )
             search_bar.click()
 
-            for _ in range(3):
-                try:
-                    self._dismiss_login_popup(timeout=2)
-                    break
-                except TimeoutException:
-                    pass
+            self._dismiss_login_popup(timeout=2)
 
         except (
             NoSuchElementException,
@@ -151,7 +151,8 @@ class GrailedScraper(BaseScraper):
             self.logger.error(
                 f"Error interacting with Grailed search bar: {e}", exc_info=True
             )
-            sys.exit(1)
+            # let the caller skip this site, the other sites' results are still written
+            raise
 
     def _dismiss_login_popup(self, timeout: int) -> None:
         """
@@ -163,31 +164,13 @@ class GrailedScraper(BaseScraper):
         Returns:
         - None
         """
-
         try:
-            login_popup = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(
-                    (
-                        By.CSS_SELECTOR,
-                        self.LOGIN_POPUP_SELECTOR,
-                    )
-                )
-            )
-
-            ActionChains(self.driver).move_to_element(login_popup).pause(
-                1
-            ).move_by_offset(250, 0).pause(1).click()
+            WebDriverWait(self.driver, timeout).until(self._LOGIN_POPUP_PRESENT)
 
+            # the popup closes on Escape, the wait returns as soon as it has gone
             ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
 
-            WebDriverWait(self.driver, 10).until_not(
-                EC.presence_of_element_located(
-                    (
-                        By.CSS_SELECTOR,
-                        self.LOGIN_POPUP_SELECTOR,
-                    )
-                )
-            )
+            WebDriverWait(self.driver, 3).until_not(self._LOGIN_POPUP_PRESENT)
 
         except TimeoutException:
             self.logger.info("Login popup did not appear within the timeout.")
@@ -1,11 +1,113 @@
+import gzip
+import mimetypes
 import os
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always offered
+    brotli = None
 
-# TODO: Render html in io_utils and then serve it here.
-class RenderAndServe(HTTPServer):
+# File types under the template directory that are served as static assets.
+STATIC_ASSET_EXTENSIONS = (".css", ".js", ".svg")
+
+# Environments and compiled templates are shared by every server in the process.
+_ENV_CACHE: dict[str, Environment] = {}
+_TEMPLATE_CACHE: dict[tuple[str, str], Template] = {}
+
+# Content codings in order of preference when the client accepts several.
+PREFERRED_ENCODINGS = ("br", "gzip")
+
+
+def get_environment(template_path):
+    """
+    Return the shared Jinja2 Environment for a template directory, creating it on first use.
+
+    Args:
+        template_path (str): The path to the template directory.
+
+    Returns:
+        Environment: The cached Environment for the directory.
+    """
+    env = _ENV_CACHE.get(template_path)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(template_path),
+            # Compiled template bytecode is persisted so later runs skip the parse/compile
+            # step. Jinja's default directory is private to the user (0700, owner checked);
+            # the cache holds code that gets executed, so it must not be shared.
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False,
+            # the template set is small and fixed, never evict compiled templates
+            cache_size=-1,
+        )
+        _ENV_CACHE[template_path] = env
+    return env
+
+
+def compress_payload(payload):
+    """
+    Precompute the compressed variants of a response body.
+
+    Args:
+        payload (bytes): The uncompressed response body.
+
+    Returns:
+        dict: Mapping of content coding ("identity", "gzip" and, if available, "br") to bytes.
+            Compressed variants are only kept when they are smaller than the original.
+    """
+    variants = {"identity": payload}
+    candidates = {"gzip": gzip.compress(payload, compresslevel=9)}
+    if brotli is not None:
+        candidates["br"] = brotli.compress(payload, quality=11)
+
+    for encoding, compressed in candidates.items():
+        if len(compressed) < len(payload):
+            variants[encoding] = compressed
+    return variants
+
+
+def get_template(template_path, template_name):
+    """
+    Return the compiled template from the shared cache, loading it on first use.
+
+    Args:
+        template_path (str): The path to the template directory.
+        template_name (str): The name of the template to load.
+
+    Returns:
+        Template: The compiled Jinja2 template.
+    """
+    key = (template_path, template_name)
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        template = get_environment(template_path).get_template(template_name)
+        _TEMPLATE_CACHE[key] = template
+    return template
+
+
+def render_html(
+    context,
+    template_path="fashioncrawler/resources/templates",
+    template_name="base_template.html.j2",
+):
+    """
+    Render a Jinja2 template to a string.
+
+    Args:
+        context (dict): The context data to pass to the template.
+        template_path (str, optional): The path to the template directory.
+        template_name (str, optional): The name of the template to render.
+
+    Returns:
+        str: The rendered HTML.
+    """
+    return get_template(template_path, template_name).render(**context)
+
+
+class RenderAndServe(ThreadingHTTPServer):
     def __init__(
         self,
         context,
@@ -16,35 +118,110 @@ class RenderAndServe(HTTPServer):
         self.template_path = template_path
         self.template_name = template_name
         self.server_address = server_address
-        self.env = Environment(loader=FileSystemLoader(self.template_path))
-        self.template = self.env.get_template(self.template_name)
+        self.env = get_environment(self.template_path)
+        self.template = get_template(self.template_path, self.template_name)
         self.context = context
 
+        # The page doesn't change while serving, so render and compress it once up front.
+        rendered_html = render_html(
+            self.context, self.template_path, self.template_name
+        ).encode("utf-8")
+        self.assets = self.load_static_assets(self.template_path)
+        self.assets[""] = (compress_payload(rendered_html), "text/html")
+
         super().__init__(self.server_address, MyHandler)
 
+    @staticmethod
+    def load_static_assets(template_path):
+        """
+        Read and compress every static asset under the template directory.
+
+        Args:
+            template_path (str): The path to the template directory.
+
+        Returns:
+            dict: Mapping of request paths (relative to template_path) to
+                (encoded payloads, content type), see compress_payload.
+        """
+        assets = {}
+        for root, _, files in os.walk(template_path):
+            for file_name in files:
+                if not file_name.endswith(STATIC_ASSET_EXTENSIONS):
+                    continue
+
+                full_path = os.path.join(root, file_name)
+                relative_path = os.path.relpath(full_path, template_path)
+                with open(full_path, "rb") as file:
+                    payload = file.read()
+
+                content_type = mimetypes.guess_type(file_name)[0]
+                assets[relative_path.replace(os.sep, "/")] = (
+                    compress_payload(payload),
+                    content_type or "application/octet-stream",
+                )
+        return assets
+
 
 class MyHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open so the page and its assets share one socket
+    protocol_version = "HTTP/1.1"
+    # Buffer wfile so the header block and body go out in a single send when the
+    # request finishes, instead of one send for the headers and another for the body.
+    wbufsize = 1 << 16
+
     def do_GET(self):
-        if self.path == "/":
-            # TODO: figure out how to fix the type
-            rendered_html = self.server.template.render(**self.server.context)
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(rendered_html.encode("utf-8"))
-        elif self.path.endswith(".css"):
-            css_file_path = self.server.template_path + "/" + self.path[1:]
-            if os.path.exists(css_file_path):
-                with open(css_file_path, "rb") as file:
-                    self.send_response(200)
-                    self.send_header("Content-type", "text/css")
-                    self.end_headers()
-                    self.wfile.write(file.read())
-
-            else:
-                self.send_error(404, "File not found")
-        else:
+        asset = self.server.assets.get(self.path.lstrip("/"))
+        if asset is None:
             self.send_error(404, "File not found")
+            return
+
+        variants, content_type = asset
+        encoding = self.choose_encoding(variants)
+        self.send_payload(variants[encoding], content_type, encoding)
+
+    def choose_encoding(self, variants):
+        """
+        Pick the best precomputed content coding the client accepts.
+
+        Args:
+            variants (dict): The available encodings for the response, see compress_payload.
+
+        Returns:
+            str: "br", "gzip" or "identity".
+        """
+        accepted = set()
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, quality = coding.replace(" ", "").partition(";q=")
+            try:
+                if quality and float(quality) == 0:
+                    continue
+            except ValueError:
+                continue
+            accepted.add(name.lower())
+
+        for encoding in PREFERRED_ENCODINGS:
+            if encoding in variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+    def send_payload(self, payload, content_type, encoding="identity"):
+        """
+        Send a 200 response with an explicit Content-Length so the connection can be reused.
+
+        Args:
+            payload (bytes): The response body.
+            content_type (str): The value for the Content-type header.
+            encoding (str): The content coding of the payload.
+        """
+        self.send_response(200)
+        self.send_header("Content-type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        if encoding != "identity":
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+        self.wfile.write(payload)
 
 
 def render_and_serve(context, **kwargs):
@@ -10,255 +10,455 @@ Licensed under the Apache License, Version 2.0 (the "License"); you may not use
 Classes:
 - IOUtils: A utility class for handling input/output operations and command-line argument parsing.
 
+Functions:
+- _build_parser(): Build the command-line argument parser.
+- _get_parser(): Return the command-line argument parser, building it on first use.
+- _yaml(): Import PyYAML and its fastest safe loader/dumper on first use.
+- _parse_config_file(config_file): Parse a YAML configuration file.
+- _load_default_config(): Load config.yaml, skipping the YAML parse while it is unchanged.
+- _get_stylesheet(css_file_path): Return the parsed PDF stylesheet, cached on its mtime.
+
 Methods:
 - parse_args(): Parse command-line arguments and configuration settings.
-- _load_config(config_file): Load configuration settings from a YAML file.
-- _enable_sites(config, site_names): Enable specific sites in the configuration.
-- _disable_sites(config, site_names): Disable specific sites in the configuration.
-- _get_output_format(args): Determine the output format based on command-line arguments.
-- _update_config_with_options(config, args): Update the configuration with command-line options.
+- _load_config(config_file=None): Load configuration settings from a YAML file or config.yaml.
+- _apply_args(config, args): Update the configuration with command-line options.
 - handle_dataframe_output(dataframes, output_filename, config): Save DataFrames to a file based on the specified output format.
 - _save_as_json(dataframes, filename): Save DataFrames to a JSON file.
-- _save_as_csv(dataframes, filename): Save DataFrames to a CSV file.
+- _save_as_csv(dataframes, filename): Save each DataFrame to its own CSV file.
 - _save_as_yaml(dataframes, filename): Save DataFrames to a YAML file.
+- _save_as_parquet(dataframes, filename): Save each DataFrame to its own Parquet file.
+- _save_as_feather(dataframes, filename): Save each DataFrame to its own Feather file.
+- _save_as_arrow(dataframes, filename): Save each DataFrame to its own Arrow IPC file.
 - _print_out_dataframes(dataframes): Print out the DataFrames.
 """
 
 import argparse
+import copy
+import functools
+import hashlib
+import importlib.util
 import json
+import logging
 import os
-import time
-from threading import Thread
-from typing import List
+import sys
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from threading import Timer
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from ..resources.config.default_config import CONFIG as DEFAULT_CONFIG
+from ..resources.config.default_config import SOURCE_HASH as DEFAULT_CONFIG_HASH
+from .html_renderer import render_and_serve, render_html
+from .utils import Utils
+
+if TYPE_CHECKING:
+    from weasyprint import CSS
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is used without it
+    orjson = None
+
+# Default configuration file, used when no config file is passed with --config.
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "resources",
+    "config",
+    "config.yaml",
+)
+
+# config.yaml as a Python literal (resources/config/default_config.py, generated from it).
+# It stands in for config.yaml while the file is unchanged, so a default run doesn't
+# parse any YAML.
+_DEFAULT_CONFIG = MappingProxyType(DEFAULT_CONFIG)
+
+# Output formats that can be selected with -f/--format or one of its shorthand flags.
+FORMAT_FLAGS = ("json", "csv", "yaml", "html", "pdf", "parquet", "feather", "arrow")
+
+# Output formats that can only be written with the optional pyarrow package installed.
+ARROW_FORMATS = ("parquet", "feather", "arrow")
+
+# Templates and the stylesheet used for HTML and PDF output.
+TEMPLATE_PATH = "fashioncrawler/resources/templates"
+STYLESHEET_PATH = os.path.join(TEMPLATE_PATH, "style.css")
+
+# Parsed WeasyPrint stylesheets keyed by path, holding (mtime, CSS).
+_CSS_CACHE: dict[str, tuple[float, "CSS"]] = {}
+
+# JSON output is encoded this many rows at a time.
+JSON_CHUNK_ROWS = 10000
+
+# Output files are written through a 1 MiB buffer to keep the number of write calls low.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Value of every command-line option that isn't given. _build_parser() registers these
+# with the parser and _DEFAULT_ARGS is built from them, so the two can't drift apart.
+_ARG_DEFAULTS = MappingProxyType(
+    {
+        "config": None,
+        "enable_site": "",
+        "disable_site": "",
+        "search": None,
+        "formats": None,
+        "output": None,
+        "output_dir": None,
+        "headless": False,
+        "sequential": False,
+        "count": None,
+    }
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser for the Fashion Crawler command-line options.
+    """
+    parser = argparse.ArgumentParser(
+        description="Fashion Crawler: A web scraper for various fashion marketplace sites."
+    )
+
+    parser.add_argument(
+        "--config",
+        help="Path to a YAML config file (uses resources/config/config.yaml if omitted)",
+        type=str,
+    )
+
+    # Site selection group to override config settings
+    site_group = parser.add_argument_group(
+        "Site selection",
+        "By default it uses the sites in the config file (Grailed and Depop)",
+    )
+
+    site_group.add_argument(
+        "--enable-site",
+        help="Enable a specific site(s) (comma-seperated list)",
+        type=str,
+    )
+
+    site_group.add_argument(
+        "--disable-site",
+        help="Disable a specific site(s) (comma-seperated list)",
+        type=str,
+    )
+
+    # Search options group
+    search_group = parser.add_argument_group("Search options")
+    search_group.add_argument(
+        "-s", "--search", help="Search query to scrape for", type=str
+    )
+
+    # Output options group
+    output_group = parser.add_argument_group(
+        "Output options",
+        "If no option is specified it prints table on command line",
+    )
+    output_group.add_argument(
+        "-f",
+        "--format",
+        help="Output format, can be given more than once (-f json -f csv)",
+        choices=FORMAT_FLAGS,
+        action="append",
+        dest="formats",
+    )
+    # Shorthands for --format, they all add to the same list
+    output_group.add_argument(
+        "-j",
+        "--json",
+        help="Output as JSON (same as -f json)",
+        action="append_const",
+        const="json",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "-c",
+        "--csv",
+        help="Output as CSV (same as -f csv)",
+        action="append_const",
+        const="csv",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "-y",
+        "--yaml",
+        help="Output as YAML (same as -f yaml)",
+        action="append_const",
+        const="yaml",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "--html",
+        help="Output HTMl using jinja2 (same as -f html)",
+        action="append_const",
+        const="html",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "--pdf",
+        help="Output a PDF (same as -f pdf)",
+        action="append_const",
+        const="pdf",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "--parquet",
+        help="Output one Parquet file per site, requires pyarrow (same as -f parquet)",
+        action="append_const",
+        const="parquet",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "--feather",
+        help="Output one Feather file per site, requires pyarrow (same as -f feather)",
+        action="append_const",
+        const="feather",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "--arrow",
+        help="Output one Arrow IPC file per site, requires pyarrow (same as -f arrow)",
+        action="append_const",
+        const="arrow",
+        dest="formats",
+    )
+    output_group.add_argument(
+        "-o", "--output", help="Ouput file name (without extension)", type=str
+    )
+    output_group.add_argument("--output-dir", help="Output directory", type=str)
+
+    output_group.add_argument(
+        "--output-formats",
+        nargs="+",
+        choices=[*FORMAT_FLAGS, "print"],
+        help="List of desired output formats (--output-formats json csv)",
+        action="extend",
+        dest="formats",
+    )
+
+    # Driver options
+    driver_group = parser.add_argument_group("Driver options")
+    driver_group.add_argument(
+        "--headless",
+        help="Run WebDriver in headless mode (WIP)",
+        action="store_true",
+    )
+    driver_group.add_argument(
+        "--sequential",
+        help="Scrape the sites one after another in a single browser instead of in parallel",
+        action="store_true",
+    )
+
+    scraping_group = parser.add_argument_group("Scraping options")
+    scraping_group.add_argument(
+        "--count", help="Specify the amount of items to scrape", type=int
+    )
+
+    parser.set_defaults(**_ARG_DEFAULTS)
+
+    return parser
+
+
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Return the command-line argument parser, building it on first use.
 
-import yaml
-from weasyprint import HTML, CSS
+    Returns:
+        argparse.ArgumentParser: The shared parser from _build_parser().
+    """
+    return _build_parser()
 
 
-# TODO: Explore class methods for using filename and context
-class IOUtils:
+# What the parser returns for an empty command line. A run without arguments uses this
+# directly instead of building the parser.
+_DEFAULT_ARGS = argparse.Namespace(**_ARG_DEFAULTS)
+
+
+@functools.cache
+def _yaml():
     """
-    A utility class for handling input/output operations and command-line argument parsing.
+    Import PyYAML on first use, along with the fastest safe loader and dumper it provides.
 
-    Methods:
-    - parse_args(): Parse command-line arguments and configuration settings.
-    - _load_config(config_file): Load configuration settings from a YAML file.
-    - _enable_sites(config, site_names): Enable specific sites in the configuration.
-    - _disable_sites(config, site_names): Disable specific sites in the configuration.
-    - _get_output_format(args): Determine the output format based on command-line arguments.
-    - _update_config_with_options(config, args): Update the configuration with command-line options.
-    - handle_dataframe_output(dataframes, output_filename, config): Save DataFrames to a file based on the specified output format.
-    - _save_as_json(dataframes, filename): Save DataFrames to a JSON file.
-    - _save_as_csv(dataframes, filename): Save DataFrames to a CSV file.
-    - _save_as_yaml(dataframes, filename): Save DataFrames to a YAML file.
-    - _print_out_dataframes(dataframes): Print out the DataFrames.
+    PyYAML is only needed when a config file is given or YAML output is requested, so a
+    default run doesn't pay for importing it.
+
+    Returns:
+        tuple: The yaml module, the SafeLoader class and the SafeDumper class.
     """
+    import yaml
 
-    @staticmethod
-    def parse_args():
-        """
-        Parse command-line arguments using the argparse module.
+    try:
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml, use the pure-Python classes
+        from yaml import SafeDumper, SafeLoader
 
-        Returns:
-            dict: Configuration settings based on command-line arguments and config file.
-        """
-        parser = argparse.ArgumentParser(
-            description="Fashion Crawler: A web scraper for various fashion marketplace sites."
+        logger.warning(
+            "PyYAML was built without libyaml, YAML config parsing and output will use "
+            "the slower pure-Python loader and dumper"
         )
 
-        # Site selection group to override config settings
-        site_group = parser.add_argument_group(
-            "Site selection",
-            "By default all are enabled or it uses the sites in config.yaml",
-        )
+    return yaml, SafeLoader, SafeDumper
 
-        site_group.add_argument(
-            "--enable-site",
-            help="Enable a specific site(s) (comma-seperated list)",
-            type=str,
-            default="",
-        )
 
-        site_group.add_argument(
-            "--disable-site",
-            help="Disable a specific site(s) (comma-seperated list)",
-            type=str,
-            default="",
-        )
+def _parse_config_file(config_file):
+    """
+    Parse a YAML configuration file.
 
-        # Search options group
-        search_group = parser.add_argument_group("Search options")
-        search_group.add_argument(
-            "-s", "--search", help="Search query to scrape for", type=str
-        )
+    Args:
+        config_file (str): Absolute path to the configuration file.
 
-        # Output options group
-        output_group = parser.add_argument_group(
-            "Output options",
-            "If no option is specified it prints table on command line",
-        )
-        output_group.add_argument(
-            "-j", "--json", help="Output as JSON", action="store_true"
-        )
-        output_group.add_argument(
-            "-c", "--csv", help="Output as CSV", action="store_true"
-        )
-        output_group.add_argument(
-            "-y", "--yaml", help="Output as YAML", action="store_true"
-        )
-        output_group.add_argument(
-            "--html", help="Output HTMl using jinja2", action="store_true"
-        )
-        output_group.add_argument("--pdf", help="Output a PDF", action="store_true")
-        output_group.add_argument(
-            "-o", "--output", help="Ouput file name (without extension)", type=str
-        )
-        output_group.add_argument("--output-dir", help="Output directory", type=str)
+    Returns:
+        dict: Configuration settings loaded from the file.
+    """
+    yaml, SafeLoader, _ = _yaml()
+    with open(config_file, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
-        output_group.add_argument(
-            "--output-formats",
-            nargs="+",
-            choices=["json", "csv", "yaml", "html", "pdf", "print"],
-            help="List of desired output formats (--output-format jsv csv)",
-        )
 
-        # Driver options
-        driver_group = parser.add_argument_group("Driver options")
-        driver_group.add_argument(
-            "--headless",
-            help="Run WebDriver in headless mode (WIP)",
-            action="store_true",
-        )
+def _load_default_config():
+    """
+    Load the default configuration from config.yaml.
 
-        scraping_group = parser.add_argument_group("Scraping options")
-        scraping_group.add_argument(
-            "--count", help="Specify the amount of items to scrape", type=int
-        )
+    While config.yaml has the contents default_config.py was generated from, the generated
+    copy is returned instead of parsing the YAML. A changed config.yaml is parsed, so edits
+    to it take effect, and a missing one falls back to the generated copy.
 
-        args = parser.parse_args()
+    Returns:
+        dict: Configuration settings (a fresh copy, callers may modify it).
+    """
+    try:
+        with open(DEFAULT_CONFIG_PATH, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return copy.deepcopy(dict(_DEFAULT_CONFIG))
 
-        # Load configuration from YAML file
-        config = IOUtils._load_config("fashioncrawler/resources/config/config.yaml")
+    if hashlib.blake2b(data, digest_size=16).hexdigest() == DEFAULT_CONFIG_HASH:
+        return copy.deepcopy(dict(_DEFAULT_CONFIG))
 
-        # update config based on command line args
-        if args.enable_site:
-            IOUtils._enable_sites(config, args.enable_site.split(","))
+    yaml, SafeLoader, _ = _yaml()
+    return yaml.load(data, Loader=SafeLoader)
 
-        if args.disable_site:
-            IOUtils._disable_sites(config, args.disable_site.split(","))
 
-        IOUtils._update_config_with_options(config, args)
+def _get_stylesheet(css_file_path):
+    """
+    Return the parsed WeasyPrint stylesheet, reparsing it only when the file changes.
 
-        return config
+    Args:
+        css_file_path (str): Path to the CSS file.
 
-    @staticmethod
-    def _load_config(config_file):
-        """
-        Load configuration settings from a YAML file.
-        If no config file is present, enable all sites by default.
+    Returns:
+        CSS: The parsed stylesheet.
+    """
+    mtime = os.path.getmtime(css_file_path)
+    cached = _CSS_CACHE.get(css_file_path)
+    if cached is None or cached[0] != mtime:
+        from weasyprint import CSS
 
-        Args:
-            config_file (str): Path to the configuration file.
+        cached = (mtime, CSS(filename=css_file_path))
+        _CSS_CACHE[css_file_path] = cached
+    return cached[1]
 
-        Returns:
-            dict: Configuration settings loaded from the file.
-        """
-        config_file = os.path.abspath(config_file)
-        try:
-            with open(config_file, "r", encoding="UTF-8") as f:
-                config = yaml.safe_load(f)
-        except FileNotFoundError:
-            # If config file not found enable all sites by default (set all but grailed to false until they're completed)
-            config = {
-                "sites": [
-                    {"name": "grailed", "enabled": True},
-                    {"name": "depop", "enabled": True},
-                    {"name": "goat", "enabled": False},
-                    {"name": "stockx", "enabled": False},
-                ]
-            }
 
-        return config
+# TODO: Explore class methods for using filename and context
+class IOUtils:
+    """
+    A utility class for handling input/output operations and command-line argument parsing.
+
+    Methods:
+    - parse_args(): Parse command-line arguments and configuration settings.
+    - _load_config(config_file=None): Load configuration settings from a YAML file or config.yaml.
+    - _apply_args(config, args): Update the configuration with command-line options.
+    - handle_dataframe_output(dataframes, output_filename, config): Save DataFrames to a file based on the specified output format.
+    - _save_as_json(dataframes, filename): Save DataFrames to a JSON file.
+    - _save_as_csv(dataframes, filename): Save each DataFrame to its own CSV file.
+    - _save_as_yaml(dataframes, filename): Save DataFrames to a YAML file.
+    - _save_as_parquet(dataframes, filename): Save each DataFrame to its own Parquet file.
+    - _save_as_feather(dataframes, filename): Save each DataFrame to its own Feather file.
+    - _save_as_arrow(dataframes, filename): Save each DataFrame to its own Arrow IPC file.
+        - _print_out_dataframes(dataframes): Print out the DataFrames.
+    """
 
     @staticmethod
-    def _enable_sites(config, site_names):
+    def parse_args():
         """
-        Enable specific sites in the configuration.
+        Parse command-line arguments using the argparse module.
 
-        Args:
-            config (dict): Configuration settings.
-            site_names (list): List of site names to enable.
+        Returns:
+            dict: Configuration settings based on command-line arguments and config file.
         """
-        list(
-            map(
-                lambda site: (
-                    site.update({"enabled": True})
-                    if site["name"] in site_names
-                    else None
-                ),
-                config["sites"],
-            )
-        )
+        # Without arguments the result is known, so skip building and running the parser
+        args = _DEFAULT_ARGS if len(sys.argv) == 1 else _get_parser().parse_args()
 
-    @staticmethod
-    def _disable_sites(config, site_names):
-        """
-        Disable specific sites in the configuration.
+        # Load configuration from YAML file
+        try:
+            config = IOUtils._load_config(args.config)
+        except FileNotFoundError:
+            # the user named this file, so a typo must not quietly run with the defaults
+            _get_parser().error(f"config file not found: {args.config}")
 
-        Args:
-            config (dict): Configuration settings.
-            site_names (list): List of site names to disable.
-        """
-        list(
-            map(
-                lambda site: (
-                    site.update({"enabled": False})
-                    if site["name"] in site_names
-                    else None
-                ),
-                config["sites"],
+        # update config based on command line args
+        IOUtils._apply_args(config, args)
+
+        # fail before scraping rather than after, when the results would be written
+        arrow_formats = [f for f in config["output_formats"] if f in ARROW_FORMATS]
+        if arrow_formats and importlib.util.find_spec("pyarrow") is None:
+            _get_parser().error(
+                f"{', '.join(arrow_formats)} output requires pyarrow, "
+                "install it with 'poetry install -E arrow' or 'pip install pyarrow'"
             )
-        )
+
+        return config
 
     @staticmethod
-    def _get_output_format(args) -> List[str]:
+    def _load_config(config_file=None):
         """
-        Determine the output format based on command-line arguments.
+        Load configuration settings from a YAML file.
+        If no config file is given, resources/config/config.yaml is used.
 
         Args:
-            args (Namespace): Parsed command-line arguments.
+            config_file (str, optional): Path to the configuration file.
 
         Returns:
-            formats (list) or None: Output formats (json, csv, yaml, html, pdf or print)
+            dict: Configuration settings loaded from the file.
+
+        Raises:
+            FileNotFoundError: If config_file is given but doesn't exist.
         """
-        formats = []
-        if args.output_formats:
-            formats.extend(args.output_formats)
-        else:
-            if args.json:
-                formats.append("json")
-            if args.csv:
-                formats.append("csv")
-            if args.yaml:
-                formats.append("yaml")
-            if args.html:
-                formats.append("html")
-            if args.pdf:
-                formats.append("pdf")
-        return formats if formats else ["print"]
+        if config_file is None:
+            return _load_default_config()
+
+        return _parse_config_file(os.path.abspath(config_file))
 
     @staticmethod
-    def _update_config_with_options(config, args):
+    def _apply_args(config, args):
         """
-        Update the configuration with search, output, and driver options from command-line arguments.
+        Update the configuration with the site, search, output, and driver options from
+        command-line arguments.
 
         Args:
             config (dict): Configuration settings.
             args (Namespace): Parsed command-line arguments.
         """
+        if args.enable_site or args.disable_site:
+            enable = frozenset(args.enable_site.split(","))
+            disable = frozenset(args.disable_site.split(","))
+            # disabling wins if a site is named in both lists
+            for site in config["sites"]:
+                if site["name"] in disable:
+                    site["enabled"] = False
+                elif site["name"] in enable:
+                    site["enabled"] = True
+
         config["search_query"] = args.search
-        config["output_formats"] = list(set(IOUtils._get_output_format(args)))
+        # argparse collects every format option into one list, drop repeats keeping the order
+        config["output_formats"] = list(dict.fromkeys(args.formats or ["print"]))
         config["headless"] = args.headless
+        config["sequential"] = args.sequential
 
         if args.output_dir:
             config["output_directory"] = args.output_dir
@@ -289,36 +489,48 @@ class IOUtils:
             os.makedirs(output_directory, exist_ok=True)
             output_filename = os.path.join(output_directory, output_filename)
 
-        format_handlers = {
-            "json": IOUtils._save_as_json,
-            "csv": IOUtils._save_as_csv,
-            "yaml": IOUtils._save_as_yaml,
-            "print": IOUtils._print_out_dataframes,
-            "pdf": IOUtils._save_as_pdf,
-            "html": IOUtils.render_and_serve_html,
-        }
+        # the html and pdf outputs render the same template context, so build it once
+        context = None
+        if not {"html", "pdf"}.isdisjoint(config["output_formats"]):
+            context = Utils.create_context_dict(
+                dataframes=dataframes,
+                search_query=search_query,
+                sites=enabled_sites,
+                subtemplates=config["subtemplates"],
+            )
+
+        # Every output file is written by its own task: one per format, or one per site for
+        # the per-site formats. pandas and pyarrow release the GIL while encoding, so the
+        # tasks run in parallel. This finishes before the html output, which blocks while
+        # the server is running.
+        tasks = []
+        for output_format in config["output_formats"]:
+            if output_format not in FILE_WRITERS:
+                continue
+            writer = FILE_WRITERS[output_format]
+            if output_format in PER_SITE_FORMATS:
+                tasks.extend((writer, {name: df}) for name, df in dataframes.items())
+            else:
+                tasks.append((writer, dataframes))
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(4, len(tasks))) as executor:
+                futures = [
+                    executor.submit(writer, frames, output_filename)
+                    for writer, frames in tasks
+                ]
+            for future in futures:
+                future.result()  # re-raise any error from the writer
 
         for output_format in config["output_formats"]:
             if output_format in ("html", "pdf"):
                 # TODO: MAYBE: seperate this into another function
-                from .html_renderer import render_and_serve
-                from .utils import Utils
-
-                context = Utils.create_context_dict(
-                    dataframes=dataframes,
-                    search_query=search_query,
-                    sites=enabled_sites,
-                    subtemplates=config["subtemplates"],
-                    output_format=output_format,
-                )
+                context["output_format"] = output_format
                 if output_format == "pdf":
-                    format_handlers[output_format](context, output_filename)
+                    IOUtils._save_as_pdf(context, output_filename)
                 else:
-                    format_handlers[output_format](context, render_and_serve)
-            elif output_format == "print":
-                format_handlers[output_format](dataframes)
-            else:
-                format_handlers[output_format](dataframes, output_filename)
+                    IOUtils.render_and_serve_html(context, render_and_serve)
+            elif output_format not in FILE_WRITERS:
+                IOUtils._print_out_dataframes(dataframes)
 
     @staticmethod
     def _save_as_json(dataframes: dict, filename: str):
@@ -332,33 +544,53 @@ class IOUtils:
         Returns:
             None
         """
-        with open(f"{filename}.json", "w", encoding="utf-8") as json_file:
-            json.dump(
-                {
-                    name: df.to_dict("records")
-                    for name, df in dataframes.items()
-                    if df is not None
-                },
-                json_file,
-                indent=4,
-            )
+        # floats are written in full and URLs and non-ASCII text as they are, which
+        # pandas' to_json doesn't do (it rounds to 10 digits and escapes "/")
+        dumps = (
+            orjson.dumps
+            if orjson
+            else lambda obj: json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        )
+
+        # Stream the records in blocks of JSON_CHUNK_ROWS rows, so only one block's JSON
+        # text is in memory at a time.
+        with open(f"{filename}.json", "wb", buffering=OUTPUT_BUFFER_SIZE) as json_file:
+            json_file.write(b"{")
+            separator = b""
+            for name, df in dataframes.items():
+                json_file.write(separator + dumps(name) + b":[")
+                for start in range(0, len(df), JSON_CHUNK_ROWS):
+                    chunk = df.iloc[start : start + JSON_CHUNK_ROWS]
+                    if start:
+                        json_file.write(b",")
+                    # strip the surrounding brackets, the records join into one array
+                    json_file.write(dumps(chunk.to_dict(orient="records"))[1:-1])
+                json_file.write(b"]")
+                separator = b","
+            json_file.write(b"}")
 
     @staticmethod
     def _save_as_csv(dataframes: dict, filename: str):
         """
-        Save DataFrames to a CSV file.
+        Save each DataFrame to its own CSV file.
 
         Args:
             dataframes: A dictionary containing the Pandas DataFrames to be saved.
-            filename: The name of the output file.
+            filename: The base name of the output files, suffixed with the site name.
 
         Returns:
             None
         """
-        with open(f"{filename}.csv", "w", encoding="UTF-8") as csv_file:
-            for df in dataframes.values():
-                if df is not None:
-                    df.to_csv(csv_file, index=False)
+        # the sites don't share columns, so each one gets a file with its own header
+        for name, df in dataframes.items():
+            with open(
+                f"{filename}_{name}.csv",
+                "w",
+                newline="",
+                encoding="UTF-8",
+                buffering=OUTPUT_BUFFER_SIZE,
+            ) as csv_file:
+                df.to_csv(csv_file, index=False, chunksize=10000, lineterminator="\n")
 
     @staticmethod
     def _save_as_yaml(dataframes: dict, filename: str):
@@ -372,10 +604,82 @@ class IOUtils:
         Returns:
             None
         """
-        combined_data = {name: df.to_dict("records") for name, df in dataframes.items()}
+        yaml, _, SafeDumper = _yaml()
+
+        with open(
+            f"{filename}.yaml", "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE
+        ) as yaml_file:
+            # Dump one site at a time so only one site's records are in memory. Each dump is
+            # a single top-level key, so together they form one mapping document.
+            for name, df in dataframes.items():
+                yaml.dump(
+                    {name: df.to_dict(orient="records")},
+                    yaml_file,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                )
+
+    @staticmethod
+    def _save_as_parquet(dataframes: dict, filename: str):
+        """
+        Save each DataFrame to its own zstd-compressed Parquet file.
+
+        Parquet stores the column types with the data, so the frames read back exactly
+        as they were written, which CSV can't do.
+
+        Args:
+            dataframes: A dictionary containing the Pandas DataFrames to be saved.
+            filename: The base name of the output files, suffixed with the site name.
+
+        Returns:
+            None
+        """
+        for name, df in dataframes.items():
+            df.to_parquet(
+                f"{filename}_{name}.parquet",
+                engine="pyarrow",
+                compression="zstd",
+                index=False,
+            )
+
+    @staticmethod
+    def _save_as_feather(dataframes: dict, filename: str):
+        """
+        Save each DataFrame to its own lz4-compressed Feather file.
+
+        Args:
+            dataframes: A dictionary containing the Pandas DataFrames to be saved.
+            filename: The base name of the output files, suffixed with the site name.
+
+        Returns:
+            None
+        """
+        for name, df in dataframes.items():
+            df.to_feather(f"{filename}_{name}.feather", compression="lz4")
+
+    @staticmethod
+    def _save_as_arrow(dataframes: dict, filename: str):
+        """
+        Save each DataFrame to its own Arrow IPC file.
+
+        The files use the Arrow IPC file format, so they can be memory-mapped and read back
+        without copying (pyarrow.ipc.open_file(pyarrow.memory_map(path)).read_all()).
+
+        Args:
+            dataframes: A dictionary containing the Pandas DataFrames to be saved.
+            filename: The base name of the output files, suffixed with the site name.
+
+        Returns:
+            None
+        """
+        # imported here so runs that don't write Arrow files don't pay for loading pyarrow
+        import pyarrow as pa
 
-        with open(f"{filename}.yaml", "w", encoding="utf-8") as yaml_file:
-            yaml.safe_dump(combined_data, yaml_file)
+        for name, df in dataframes.items():
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with pa.OSFile(f"{filename}_{name}.arrow", "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
 
     @staticmethod
     def _print_out_dataframes(dataframes: dict):
@@ -391,38 +695,53 @@ class IOUtils:
         for name, df in dataframes.items():
             print(f"{name}\n", df)
 
-    @classmethod
-    def _save_as_pdf(cls, context, filename):
-        from .html_renderer import render_and_serve
+    @staticmethod
+    def _save_as_pdf(context, filename):
+        """
+        Render the HTML template and convert it to a PDF file with WeasyPrint.
 
-        server = render_and_serve(context)
-        server_thread = Thread(target=server.serve_forever)
-        server_thread.daemon = (
-            True  # Allow the program to exit when main thread finishes
-        )
-        server_thread.start()
+        Args:
+            context (dict): The template context.
+            filename: The name of the output file.
 
-        time.sleep(5)
-        css_file_path = "fashioncrawler/resources/templates/style.css"
-        with open(css_file_path) as f:
-            css_content = f.read()
+        Returns:
+            None
+        """
+        # WeasyPrint is slow to import and only needed here, so it is loaded on first use
+        from weasyprint import HTML
 
-        try:
-            url = f"http://{server.server_address[0]}:{server.server_address[1]}"
-            HTML(url=url).write_pdf(
-                f"{filename}.pdf", stylesheets=[CSS(string=css_content)]
-            )
-        finally:
-            server.shutdown()
+        # base_url lets WeasyPrint resolve the template's relative links (style.css)
+        HTML(string=render_html(context), base_url=TEMPLATE_PATH).write_pdf(
+            f"{filename}.pdf", stylesheets=[_get_stylesheet(STYLESHEET_PATH)]
+        )
 
     @staticmethod
     def render_and_serve_html(context, renderer):
+        server = renderer(context)
+        url = f"http://{server.server_address[0]}:{server.server_address[1]}/"
         try:
-            server = renderer(context)
-            print(
-                f"Server running at http://{server.server_address[0]}:{server.server_address[1]}/"
-            )
+            print(f"Server running at {url}")
+
+            # serve_forever blocks, so open the browser from a timer once it is listening
+            browser_timer = Timer(0.3, webbrowser.open, args=(url,))
+            browser_timer.daemon = True
+            browser_timer.start()
+
             server.serve_forever()
         except KeyboardInterrupt:
             print("^C Received, shutting down server")
             server.server_close()
+
+
+# Output formats that write the DataFrames to files named after the output filename.
+# Adding a file format only needs a _save_as_* method and an entry here.
+FILE_WRITERS = {
+    "json": IOUtils._save_as_json,
+    "csv": IOUtils._save_as_csv,
+    "yaml": IOUtils._save_as_yaml,
+    "parquet": IOUtils._save_as_parquet,
+    "feather": IOUtils._save_as_feather,
+    "arrow": IOUtils._save_as_arrow,
+}
+# File formats that write one file per site, so each site can be written as its own task.
+PER_SITE_FORMATS = frozenset(("csv", "parquet", "feather", "arrow"))
@@ -9,11 +9,24 @@ Licensed under the Apache License, Version 2.0 (the "License"); you may not use
 
 Functions:
 - configure_logger(): Configure the logging system.
+- _ensure_logdir(logs_dir): Create the log directory once per process.
+- _stop_listener(): Stop the queue listener, writing out any queued records.
 """
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import threading
+
+# Background thread that writes queued records to the real handlers, see configure_logger.
+_listener = None
+_configure_lock = threading.Lock()
+
+# Log directories already created by this process
+_LOGDIR_READY: set[str] = set()
 
 
 def configure_logger():
@@ -21,15 +34,22 @@ def configure_logger():
     Configure the logging system.
 
     This function sets up the logging configuration, including the log format,
-    log file location, log level, and rotation settings.
+    log file location, log level, and rotation settings. Only the first call configures
+    anything, later calls return the logger straight away.
 
     Returns:
         logger: The configured logger object.
     """
 
+    global _listener
+
+    # every scraper and extractor calls this, the setup only needs to happen once
+    if _listener is not None:
+        return logging.getLogger(__name__)
+
     # Create logs directory if it doesn't exist
     logs_dir = "logs"
-    os.makedirs(logs_dir, exist_ok=True)
+    _ensure_logdir(logs_dir)
 
     logging_config = {
         "version": 1,
@@ -51,11 +71,19 @@ def configure_logger():
                 "backupCount": 3,
                 "formatter": "debug_formatter",
                 "level": "DEBUG",
-            }
+            },
+            # Batches records in memory and writes them to "file" 1024 at a time,
+            # or straight away when an ERROR comes in.
+            "buffered": {
+                "class": "logging.handlers.MemoryHandler",
+                "capacity": 1024,
+                "flushLevel": logging.ERROR,
+                "target": "file",
+            },
         },
         "loggers": {
             "": {
-                "handlers": ["file"],
+                "handlers": ["buffered"],
                 "level": "DEBUG",
             }
         },
@@ -65,8 +93,54 @@ def configure_logger():
         },
     }
 
-    logging.config.dictConfig(logging_config)
+    # scrapers running on separate threads may configure logging at the same time
+    with _configure_lock:
+        if _listener is not None:
+            return logging.getLogger(__name__)
+
+        logging.config.dictConfig(logging_config)
+
+        # Loggers only put records on a queue; a listener thread does the formatting and the
+        # file writes, so logging calls on the scraping threads don't block on disk I/O.
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers[:]
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
 
     logger = logging.getLogger(__name__)
 
     return logger
+
+
+def _ensure_logdir(logs_dir):
+    """
+    Create the log directory the first time it is needed, skipping the check afterwards.
+
+    Args:
+        logs_dir (str): Path to the log directory.
+    """
+    if logs_dir not in _LOGDIR_READY:
+        os.makedirs(logs_dir, exist_ok=True)
+        _LOGDIR_READY.add(logs_dir)
+
+
+def _stop_listener():
+    """
+    Stop the queue listener, writing out any records still on the queue.
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Flush the queued records when the interpreter exits
+atexit.register(_stop_listener)
@@ -11,7 +11,18 @@ Functions:
 - convert_to_datetime(time_str_list): Convert a list of time strings to datetime objects.
 """
 
-from datetime import datetime, timedelta
+import re
+
+# Leading "<n> <unit>" of a relative post time such as "3 days ago"
+_TIME_AGO_RE = re.compile(r"^(\d+)\s+(\w+)")
+
+# Time units in the "<n> <unit>(s) ago" strings, with the pandas timedelta unit
+# and the strftime format used to display the resulting time.
+_UNIT_FORMATS = {
+    "day": ("D", "%a, %B %d"),
+    "hour": ("h", "%a, %B %d at about %I%p"),
+    "minute": ("min", "%a, %B %d at %I:%M%p"),
+}
 
 
 class Utils:
@@ -22,42 +33,45 @@ class Utils:
     - convert_to_datetime(time_str_list): Convert a list of time strings to datetime objects.
     """
 
-    # TODO: optimize this (check testing/testing.py)
     @classmethod
     def convert_to_datetime(cls, time_str_list):
         """
         Convert a list of time strings to datetime objects.
 
+        The strings ("3 days ago", "1 hour ago", ...) are parsed and shifted back from the
+        current time as one pandas Series instead of one item at a time.
+
         Args:
             time_str_list (list): A list of time strings.
 
         Returns:
             list: A list of formatted datetime strings.
+
+        Raises:
+            ValueError: If a time string doesn't start with a number of days, hours or minutes.
         """
-        datetime_list = []
-
-        for time_str in time_str_list:
-            parts = time_str.split(" ")
-            num = int(parts[0])
-            unit = parts[1]
-
-            if unit in ("days", "day"):
-                delta = timedelta(days=num)
-                tformat = "%a, %B %d"
-            elif unit in ("hours", "hour"):
-                delta = timedelta(hours=num)
-                tformat = "%a, %B %d at about %I%p"
-            elif unit in ("minutes", "minute"):
-                delta = timedelta(minutes=num)
-                tformat = "%a, %B %d at %I:%M%p"
-            else:
-                raise ValueError("Invalid unit")
-
-            datetime_string = datetime.now() - delta
-            formatted_string = datetime_string.strftime(tformat)
-            datetime_list.append(formatted_string)
-
-        return datetime_list
+        if not time_str_list:
+            return []
+
+        # imported here so loading Utils (e.g. for create_context_dict) doesn't import pandas
+        import pandas as pd
+
+        parts = pd.Series(time_str_list, dtype=object).str.extract(_TIME_AGO_RE)
+        units = parts[1].str.rstrip("s")
+        if parts[0].isna().any() or not units.isin(_UNIT_FORMATS).all():
+            raise ValueError("Invalid unit")
+
+        nums = parts[0].astype("int64")
+        now = pd.Timestamp.now()
+        datetime_list = pd.Series(index=parts.index, dtype=object)
+
+        for unit, (timedelta_unit, tformat) in _UNIT_FORMATS.items():
+            mask = units == unit
+            if mask.any():
+                times = now - pd.to_timedelta(nums[mask], unit=timedelta_unit)
+                datetime_list[mask] = times.dt.strftime(tformat)
+
+        return datetime_list.tolist()
 
     @staticmethod
     def create_context_dict(dataframes, **kwargs):
@@ -0,0 +1,79 @@
+import json
+
+import pandas as pd
+
+from fashioncrawler.utils import io_utils
+from fashioncrawler.utils.io_utils import IOUtils
+
+
+def _listings():
+    return {
+        "grailed": pd.DataFrame(
+            {
+                "Title": ["Café Racer Jacket", "Nike Air Force 1 – “Triple White”"],
+                "Price": [129.99, 1 / 3],
+                "Link": [
+                    "https://www.grailed.com/listings/1234-cafe-racer",
+                    "https://www.grailed.com/listings/5678-af1?size=10/11",
+                ],
+                "Count": [1, 2],
+            }
+        ),
+        "depop": pd.DataFrame(
+            {
+                "Title": ["Vintage Levi’s 501"],
+                "Price": [0.1 + 0.2],
+                "Link": ["https://www.depop.com/products/seller-levis-501/"],
+                "Count": [3],
+            }
+        ),
+    }
+
+
+def _baseline_json(dataframes):
+    """The JSON output as it was written before it was streamed in blocks."""
+    return json.dumps(
+        {name: df.to_dict("records") for name, df in dataframes.items()}, indent=4
+    )
+
+
+def test_save_as_json_matches_baseline_output(tmp_path):
+    dataframes = _listings()
+    IOUtils._save_as_json(dataframes, str(tmp_path / "out"))
+
+    text = (tmp_path / "out.json").read_text(encoding="utf-8")
+
+    assert json.loads(text) == json.loads(_baseline_json(dataframes))
+    assert "https://www.grailed.com/listings/1234-cafe-racer" in text
+    assert "Café Racer Jacket" in text
+
+
+def test_save_as_json_across_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(io_utils, "JSON_CHUNK_ROWS", 1)
+    dataframes = _listings()
+    IOUtils._save_as_json(dataframes, str(tmp_path / "out"))
+
+    text = (tmp_path / "out.json").read_text(encoding="utf-8")
+
+    assert json.loads(text) == json.loads(_baseline_json(dataframes))
+
+
+def test_save_as_yaml_matches_baseline_output(tmp_path):
+    import yaml
+
+    dataframes = _listings()
+    IOUtils._save_as_yaml(dataframes, str(tmp_path / "out"))
+
+    with open(tmp_path / "out.yaml", encoding="utf-8") as f:
+        loaded = yaml.safe_load(f)
+
+    assert loaded == {name: df.to_dict("records") for name, df in dataframes.items()}
+
+
+def test_save_as_csv_matches_pandas_output(tmp_path):
+    dataframes = _listings()
+    IOUtils._save_as_csv(dataframes, str(tmp_path / "out"))
+
+    for name, df in dataframes.items():
+        text = (tmp_path / f"out_{name}.csv").read_text(encoding="utf-8")
+        assert text == df.to_csv(index=False, lineterminator="\n")